@@ -0,0 +1,669 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+import ctypes
+import os
+import sys
+import subprocess
+import argparse
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+
+_SHERB_NOCONFIRMATION = 1
+_SHERB_NOPROGRESSUI = 2
+_SHERB_NOSOUND = 4
+
+# Prefer the RE2 engine for the netsh parsing patterns when it's
+# installed: it guarantees linear-time matching, while stdlib re
+# backtracks. The patterns are plain enough to work on either engine.
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+_WIFI_PROFILE_RE = _re.compile(r"All User Profile\s*:\s*(.+)")
+_WIFI_KEY_RE = _re.compile(r"Key Content\s*:\s*(.+)")
+_ADAPTER_HEADER_RE = _re.compile(r"Admin State\s+State\s+Type\s+Interface Name")
+
+
+launched_interactive = False
+
+
+def get_temp_dir() -> str:
+    return os.path.abspath(os.environ.get("TEMP") or os.environ.get("TMP") or tempfile.gettempdir())
+
+
+_SHEmptyRecycleBinW = None
+
+
+def _sh_empty_recycle_bin():
+    """
+    Resolve SHEmptyRecycleBinW once with explicit argtypes/restype so the
+    FFI thunk is built a single time and later calls skip ctypes' default
+    argument inference. Resolved lazily since ctypes.windll is Windows-only.
+    """
+    global _SHEmptyRecycleBinW
+    if _SHEmptyRecycleBinW is None:
+        fn = ctypes.windll.shell32.SHEmptyRecycleBinW
+        fn.argtypes = (ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_uint)
+        fn.restype = ctypes.c_long  # HRESULT
+        _SHEmptyRecycleBinW = fn
+    return _SHEmptyRecycleBinW
+
+
+def empty_recycle_bin(dry_run: bool = False) -> Tuple[bool, str]:
+    """
+    Permanently empties the Recycle Bin for all drives using SHEmptyRecycleBinW.
+    Returns (success, message).
+    """
+    if dry_run:
+        return True, "Dry-run: would call SHEmptyRecycleBinW for all drives."
+
+    try:
+        flags = _SHERB_NOCONFIRMATION | _SHERB_NOPROGRESSUI | _SHERB_NOSOUND
+
+        hr = _sh_empty_recycle_bin()(None, None, flags)
+        if hr == 0:
+            return True, "Recycle Bin emptied."
+
+        return False, f"SHEmptyRecycleBinW returned HRESULT 0x{hr:08X}"
+    except Exception as ex:
+        return False, f"Exception calling SHEmptyRecycleBinW: {ex}"
+
+
+_ADAPTER_CACHE = {"ts": 0.0, "val": []}
+_ADAPTER_CACHE_TTL = 30.0
+
+
+def list_network_adapters() -> List[str]:
+    """
+    Use 'netsh interface show interface' to list adapter names.
+    Returns a list of adapter names.
+    The result is cached for a short TTL; the adapter set is effectively
+    static on a session timescale and re-spawning netsh per menu visit
+    is the dominant cost.
+    """
+    if _ADAPTER_CACHE["val"] and time.monotonic() - _ADAPTER_CACHE["ts"] < _ADAPTER_CACHE_TTL:
+        return _ADAPTER_CACHE["val"]
+
+    adapters = []
+
+    started = False
+    # Stream the pipe line by line instead of buffering the whole output.
+    with subprocess.Popen(
+        ["netsh", "interface", "show", "interface"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        for ln in proc.stdout:
+            if not started:
+                if _ADAPTER_HEADER_RE.search(ln):
+                    started = True
+                continue
+            if not ln.strip():
+                continue
+
+            parts = ln.split(None, 3)
+            if len(parts) == 4:
+                adapters.append(parts[3].strip())
+    if proc.returncode != 0:
+        return []
+    _ADAPTER_CACHE["ts"] = time.monotonic()
+    _ADAPTER_CACHE["val"] = adapters
+    return adapters
+
+
+def _invalidate_adapter_cache() -> None:
+    _ADAPTER_CACHE["ts"] = 0.0
+
+
+list_network_adapters.invalidate = _invalidate_adapter_cache
+
+
+def restart_adapter(adapter_name: str, dry_run: bool = False) -> Tuple[bool, str]:
+    """
+    Disable then re-enable a network adapter by name using netsh.
+    Returns (success, message).
+    """
+    if dry_run:
+        return True, f"Dry-run: would restart adapter '{adapter_name}'."
+
+    # Run both state changes inside one netsh process via -f instead of
+    # paying process startup twice per adapter.
+    script = tempfile.NamedTemporaryFile("w", suffix=".netsh", delete=False)
+    try:
+        script.write(
+            f'interface set interface "{adapter_name}" admin=DISABLED\n'
+            f'interface set interface "{adapter_name}" admin=ENABLED\n'
+        )
+        script.close()
+        # Success output is discarded, so skip text-mode decoding and only
+        # decode stderr on the failure path.
+        subprocess.run(
+            ["netsh", "-f", script.name],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        # The adapter's state just changed; make the next listing re-query
+        # netsh instead of serving the pre-restart snapshot.
+        list_network_adapters.invalidate()
+        return True, f"Adapter '{adapter_name}' restarted."
+    except subprocess.CalledProcessError as ex:
+        err = ex.stderr.decode(errors="replace").strip() if ex.stderr else ex
+        return False, f"Command failed for '{adapter_name}': {err}"
+    finally:
+        try:
+            os.unlink(script.name)
+        except OSError:
+            pass
+
+
+def apply_tcp_optimizations(dry_run: bool = False) -> Tuple[bool, str]:
+    """
+    Apply a set of conservative TCP/network optimizations using netsh.
+    These are safe, reversible netsh commands. They may require elevated privileges.
+    Returns (success, message).
+    """
+    commands = [
+        ["netsh", "int", "tcp", "set", "global", "autotuninglevel=normal"],
+        ["netsh", "int", "tcp", "set", "global", "rss=enabled"],
+        ["netsh", "int", "tcp", "set", "global", "chimney=disabled"],
+        ["netsh", "int", "tcp", "set", "global", "ecncapability=disabled"],
+        ["netsh", "int", "tcp", "set", "heuristics", "disabled"],
+    ]
+
+    if dry_run:
+        return True, "Dry-run: would run netsh commands:\n" + "\n".join(" ".join(c) for c in commands)
+
+    # netsh -f runs the whole batch inside one netsh process, so we pay
+    # process startup once instead of once per command.
+    script = tempfile.NamedTemporaryFile("w", suffix=".netsh", delete=False)
+    try:
+        script.write("\n".join(" ".join(cmd[1:]) for cmd in commands) + "\n")
+        script.close()
+        try:
+            proc = subprocess.run(["netsh", "-f", script.name], capture_output=True, check=True)
+        except subprocess.CalledProcessError as ex:
+            err = ex.stderr.decode(errors="replace").strip() if ex.stderr else ex
+            return False, f"netsh -f failed: {err}"
+
+        # netsh -f echoes each script line before printing its result, so
+        # attribute every "Ok." to the most recently echoed command rather
+        # than assuming the successes came first.
+        out = proc.stdout.decode(errors="replace")
+        bodies = [" ".join(cmd[1:]) for cmd in commands]
+        ok_flags = [False] * len(commands)
+        cur = -1
+        for ln in out.splitlines():
+            stripped = ln.strip()
+            if cur + 1 < len(bodies) and bodies[cur + 1] in stripped:
+                cur += 1
+            elif stripped == "Ok." and cur >= 0:
+                ok_flags[cur] = True
+        if cur < 0:
+            # No command echoes to attribute against (localized or terse
+            # netsh output): report the aggregate only.
+            ok_count = sum(1 for ln in out.splitlines() if ln.strip() == "Ok.")
+            return True, f"{ok_count} of {len(commands)} netsh commands reported Ok."
+        return True, "\n".join(
+            f"{'OK' if ok else 'FAILED'}: {' '.join(cmd)}" for ok, cmd in zip(ok_flags, commands)
+        )
+    finally:
+        try:
+            os.unlink(script.name)
+        except OSError:
+            pass
+
+
+def _walk_bottom_up(path: str):
+    """
+    Yield (full_path, is_dir) for every entry under `path` in post-order.
+    Uses os.scandir so entry types come from the cached DirEntry instead of
+    an extra stat call per entry.
+    """
+    try:
+        scandir_it = os.scandir(path)
+    except OSError:
+        return
+    with scandir_it:
+        for entry in scandir_it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_bottom_up(entry.path)
+                yield entry.path, True
+            else:
+                yield entry.path, False
+
+
+def clean_temp_dir(dry_run: bool = False, fast: bool = False) -> Tuple[bool, str]:
+    """
+    Removes files and empty directories inside %TEMP% (non-recursive destructive removal).
+    By default this function is intentionally conservative: it only attempts to remove
+    files and then empty directories using os.remove and os.rmdir, and will not
+    recursively rmtree unknown directories to avoid accidental data loss.
+    With fast=True (--fast-clean) the walk is instead delegated to a single cmd.exe
+    pass of 'del /q /s' plus 'rd /s /q', which DOES remove directory trees.
+    """
+    temp_dir = get_temp_dir()
+    if not os.path.exists(temp_dir):
+        return False, f"Temp directory '{temp_dir}' does not exist."
+
+    if fast and not dry_run:
+        # Opt-in fast path: one cmd.exe invocation drives the whole
+        # destructive walk with the shell's own enumeration instead of a
+        # Python round trip per file. del/rd don't reflect per-file
+        # failures in the exit code, so counts are parsed from the
+        # transcript and reported as approximate.
+        proc = subprocess.run(
+            f'del /q /s "{temp_dir}\\*.*" & for /d %i in ("{temp_dir}\\*") do rd /s /q "%i"',
+            shell=True,
+            capture_output=True,
+        )
+        if proc.returncode == 0:
+            deleted = proc.stdout.decode(errors="replace").count("Deleted file")
+            failed = sum(1 for ln in proc.stderr.decode(errors="replace").splitlines() if ln.strip())
+            return True, f"Shell pass done. Deleted (approx.): {deleted}. Failed (approx.): {failed}."
+        # Hard failure of the shell pass: fall through to the walker.
+
+    files = []
+    dirs = []
+    for fp, is_dir in _walk_bottom_up(temp_dir):
+        (dirs if is_dir else files).append(fp)
+
+    if dry_run:
+        return True, f"Planned deletions: {len(files) + len(dirs)}. Failed deletions: 0."
+
+    # Default-arg binding makes the unlink a LOAD_FAST instead of a
+    # module attribute lookup on every file.
+    def _safe_unlink(fp: str, _unlink=os.unlink) -> Tuple[int, int]:
+        try:
+            _unlink(fp)
+            return 1, 0
+        except Exception:
+            return 0, 1
+
+    deleted = 0
+    failed = 0
+
+    # Each unlink blocks on a filesystem syscall and releases the GIL, so
+    # fanning the files out across a thread pool overlaps their latency.
+    if files:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 8)) as ex:
+            for d, f in ex.map(_safe_unlink, files):
+                deleted += d
+                failed += f
+
+    # Directories must go serially after their contents; _walk_bottom_up
+    # already yields them children-first.
+    _rmdir = os.rmdir
+    for dp in dirs:
+        try:
+            _rmdir(dp)
+            deleted += 1
+        except Exception:
+            pass
+
+    return True, f"Planned deletions: {deleted}. Failed deletions: {failed}."
+
+
+def list_wifi_profiles() -> List[str]:
+    """
+    Return a list of Wi-Fi profile names stored on the system.
+    """
+    profiles = []
+    with subprocess.Popen(
+        ["netsh", "wlan", "show", "profiles"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        for ln in proc.stdout:
+            m = _WIFI_PROFILE_RE.search(ln)
+            if m:
+                profiles.append(m.group(1).strip())
+    if proc.returncode != 0:
+        return []
+    return profiles
+
+
+_WIFI_PW_CACHE: dict = {}
+
+
+def get_wifi_password(profile: str) -> Tuple[bool, str]:
+    """
+    Query netsh for the specified profile and extract the Key Content (password).
+    Returns (found, password-or-message).
+    Definitive answers are cached so repeated menu runs don't re-shell out per
+    profile; transient netsh failures are not cached and will be retried.
+    Pass --refresh-wifi to drop the cache and re-query every profile.
+    """
+    cached = _WIFI_PW_CACHE.get(profile)
+    if cached is not None:
+        return cached
+    with subprocess.Popen(
+        ["netsh", "wlan", "show", "profile", profile, "key=clear"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        for ln in proc.stdout:
+            m = _WIFI_KEY_RE.search(ln)
+            if m:
+                # Short-circuit as soon as the key line shows up; the rest
+                # of the profile dump doesn't need to be read or buffered.
+                result = (True, m.group(1).strip())
+                _WIFI_PW_CACHE[profile] = result
+                return result
+    if proc.returncode != 0:
+        return False, f"Failed to query profile: netsh exited with code {proc.returncode}"
+    result = (False, "No password stored (open network or not available).")
+    _WIFI_PW_CACHE[profile] = result
+    return result
+
+
+def show_wifi_passwords(dry_run: bool = False) -> Tuple[bool, str]:
+    if dry_run:
+        return True, "Dry-run: would list saved Wi-Fi profiles and their passwords."
+    profiles = list_wifi_profiles()
+    if not profiles:
+        return False, "No Wi-Fi profiles found or failed to query profiles."
+    # Each query blocks on a netsh child process, so run them concurrently;
+    # ex.map keeps the results in profile order.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(get_wifi_password, profiles))
+    out_lines = []
+    for p, (ok, pw) in zip(profiles, results):
+        out_lines.append(f"{p}: {pw}")
+    return True, "\n".join(out_lines)
+
+
+def _spinner_worker(done_event: threading.Event, prefix: str) -> None:
+    # Preformat the constant part of each frame once; only the elapsed
+    # seconds vary between ticks.
+    frames = [f"\r{prefix} {f} Elapsed: " for f in ("|", "/", "-", "\\")]
+    _out = sys.stdout.write
+    _flush = sys.stdout.flush
+    i = 0
+    start = time.monotonic()
+    while not done_event.is_set():
+        elapsed = int(time.monotonic() - start)
+        _out(f"{frames[i % len(frames)]}{elapsed}s")
+        # Each flush can take the console lock; every fourth tick keeps the
+        # display fresh at this frame rate without hammering it.
+        if i % 4 == 0:
+            _flush()
+        i += 1
+        time.sleep(0.12)
+
+    _out("\r" + " " * 80 + "\r")
+    _flush()
+
+
+def run_with_spinner(func, *args, prefix: str = "Working...", **kwargs):
+    """
+    Run `func(*args, **kwargs)` in a background thread while showing a spinner
+    on the main thread. Returns the function's return value.
+    """
+    done = threading.Event()
+    result = {}
+
+    def target():
+        try:
+            result["value"] = func(*args, **kwargs)
+        except Exception as ex:
+            result["exc"] = ex
+        finally:
+            done.set()
+
+    th = threading.Thread(target=target, daemon=True)
+    th.start()
+    _spinner_worker(done, prefix)
+    th.join()
+    if "exc" in result:
+        raise result["exc"]
+    return result.get("value")
+
+
+def interactive_menu() -> List[str]:
+    choices = []
+    print("======================================================")
+    print("        Windows optimizer - Interactive Menu")
+    print("  Made by Sambota, Cat Eating a chips (AKA MitkoBG)")
+    print("======================================================")
+    print("Choose actions to perform (comma-separated numbers):")
+    print(" 1) Clean %TEMP%")
+    print(" 2) Empty Recycle Bin")
+    print(" 3) Optimize TCP (apply recommended netsh settings)")
+    print(" 4) Restart network adapters (list will be shown)")
+    print(" 5) Show saved wifi passwords on PC")
+    print(" 6) Run all")
+    print(" 7) Create God Mode folder on Desktop")
+
+    raw = input("Selection (e.g. 1,2): ").strip()
+    if not raw:
+        return choices
+
+    mapping = {
+        "1": "temp",
+        "2": "recycle",
+        "3": "tcp",
+        "4": "restart",
+        "5": "wifi",
+        "7": "godmode",
+    }
+
+    # A set gives O(1) membership for the "6" check and deduplicates
+    # repeated tokens in one pass.
+    tokens = {t.strip() for t in raw.split(",") if t.strip()}
+
+    if "6" in tokens:
+        return ["temp", "recycle", "tcp", "restart", "wifi", "godmode"]
+
+    for key, action in mapping.items():
+        if key in tokens:
+            choices.append(action)
+
+    return choices
+
+
+def ensure_confirm(prompt: str, assume_yes: bool) -> bool:
+    if assume_yes:
+        return True
+    try:
+        ans = input(prompt + " [y/N]: ").strip().lower()
+    except EOFError:
+        return False
+    return ans in ("y", "yes")
+
+
+def create_god_mode(dry_run: bool = False) -> Tuple[bool, str]:
+    """Create a God Mode folder on the current user's Desktop."""
+    desktop = os.path.join(os.path.expanduser("~"), "Desktop")
+    guid = "GodMode.{ED7BA470-8E54-465E-825C-99712043E01C}"
+    path = os.path.join(desktop, guid)
+    if dry_run:
+        return True, f"Dry-run: would create '{path}'"
+    # EAFP: one mkdir instead of two os.path.exists stat calls first.
+    try:
+        os.mkdir(path)
+        return True, f"Created God Mode folder: {path}"
+    except FileExistsError:
+        return True, f"God Mode folder already exists: {path}"
+    except FileNotFoundError:
+        return False, f"Desktop path not found: {desktop}"
+    except Exception as ex:
+        return False, f"Failed to create God Mode folder: {ex}"
+
+
+def run_actions(actions: List[str], dry_run: bool = False, assume_yes: bool = False, fast_clean: bool = False, refresh_wifi: bool = False) -> None:
+    if not actions:
+        print("No actions selected.")
+        return
+
+    if "temp" in actions:
+        if not ensure_confirm("Proceed to clean %TEMP%?", assume_yes):
+            print("Skipped %TEMP% cleanup.")
+        else:
+            ok, msg = run_with_spinner(clean_temp_dir, dry_run=dry_run, fast=fast_clean, prefix="Cleaning %TEMP%...")
+            print("Clean %TEMP% ->", msg)
+
+    if "recycle" in actions:
+        if not ensure_confirm("Proceed to empty the Recycle Bin?", assume_yes):
+            print("Skipped Recycle Bin empty.")
+        else:
+            ok, msg = run_with_spinner(empty_recycle_bin, dry_run=dry_run, prefix="Emptying Recycle Bin...")
+            print("Empty Recycle Bin ->", msg)
+
+    if "tcp" in actions:
+        if not ensure_confirm("Proceed to apply TCP optimizations? (may require admin)", assume_yes):
+            print("Skipped TCP optimizations.")
+        else:
+            ok, msg = run_with_spinner(apply_tcp_optimizations, dry_run=dry_run, prefix="Applying TCP optimizations...")
+            print("TCP optimizations ->")
+            print(msg)
+
+    if "restart" in actions:
+        adapters = list_network_adapters()
+        if not adapters:
+            print("No adapters found or failed to list adapters.")
+        else:
+            print("Network adapters:")
+            for i, a in enumerate(adapters, start=1):
+                print(f" {i}) {a}")
+            sel = input("Enter adapter numbers to restart (comma-separated) or 'all': ").strip()
+            if not sel:
+                print("No adapters selected; skipping restart.")
+            else:
+                targets = []
+                if sel.lower() == "all":
+                    targets = adapters
+                else:
+                    for tok in sel.split(","):
+                        tok = tok.strip()
+                        if not tok:
+                            continue
+                        try:
+                            idx = int(tok) - 1
+                            if 0 <= idx < len(adapters):
+                                targets.append(adapters[idx])
+                        except ValueError:
+                            if tok in adapters:
+                                targets.append(tok)
+                confirmed = []
+                for name in targets:
+                    if not ensure_confirm(f"Restart adapter '{name}'? This will briefly disconnect network.", assume_yes):
+                        print(f"Skipped restarting '{name}'.")
+                        continue
+                    confirmed.append(name)
+                if confirmed:
+                    # Adapters are independent, so fire the restarts
+                    # concurrently and overlap the driver re-enable delays.
+                    def _restart_all(names):
+                        with ThreadPoolExecutor(max_workers=len(names)) as ex:
+                            return list(ex.map(lambda n: restart_adapter(n, dry_run=dry_run), names))
+
+                    results = run_with_spinner(_restart_all, confirmed, prefix="Restarting adapters...")
+                    for name, (ok, msg) in zip(confirmed, results):
+                        print(f"Restart '{name}' -> {msg}")
+
+    if "wifi" in actions:
+        if not ensure_confirm("Proceed to list Wi‑Fi profiles and passwords? (requires appropriate privileges)", assume_yes):
+            print("Skipped Wi‑Fi password listing.")
+        else:
+            if refresh_wifi:
+                _WIFI_PW_CACHE.clear()
+            ok, msg = run_with_spinner(show_wifi_passwords, dry_run=dry_run, prefix="Gathering Wi‑Fi profiles...")
+            print("Wi‑Fi profiles & passwords ->")
+            print(msg)
+
+    if "godmode" in actions:
+        if not ensure_confirm("Create God Mode folder on Desktop?", assume_yes):
+            print("Skipped God Mode creation.")
+        else:
+            ok, msg = create_god_mode(dry_run=dry_run)
+            print(msg)
+
+
+def parse_cli() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Windows Optimizer: clean temp, empty recycle bin, optimize network adapters.")
+
+    parser.add_argument("--clean-temp", action="store_true", help="Clean %%TEMP%% directory.")
+    parser.add_argument("--empty-recycle", action="store_true", help="Empty the Recycle Bin.")
+    parser.add_argument("--optimize-tcp", action="store_true", help="Apply conservative TCP/netsh optimizations.")
+    parser.add_argument("--restart-adapters", action="store_true", help="Restart selected network adapters.")
+    parser.add_argument("--show-wifi", action="store_true", help="Show saved Wi‑Fi profiles and passwords.")
+    parser.add_argument("--refresh-wifi", action="store_true", help="Ignore cached Wi‑Fi passwords and re-query netsh.")
+    parser.add_argument("--all", action="store_true", help="Run all actions.")
+    parser.add_argument("--fast-clean", action="store_true", help="Clean %%TEMP%% with a single shell pass (also removes directory trees).")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes.")
+    parser.add_argument("--yes", action="store_true", help="Assume yes to all confirmations.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    global launched_interactive
+    args = parse_cli()
+    actions = []
+
+    cli_flags = any(
+        [
+            args.clean_temp,
+            args.empty_recycle,
+            args.optimize_tcp,
+            args.restart_adapters,
+            args.show_wifi,
+            args.all,
+        ]
+    )
+
+    if args.all:
+        actions = ["temp", "recycle", "tcp", "restart", "wifi", "godmode"]
+    else:
+        if args.clean_temp:
+            actions.append("temp")
+        if args.empty_recycle:
+            actions.append("recycle")
+        if args.optimize_tcp:
+            actions.append("tcp")
+        if args.restart_adapters:
+            actions.append("restart")
+        if args.show_wifi:
+            actions.append("wifi")
+
+    if cli_flags:
+        run_actions(actions, dry_run=args.dry_run, assume_yes=args.yes, fast_clean=args.fast_clean, refresh_wifi=args.refresh_wifi)
+        return 0
+
+    launched_interactive = True
+    while True:
+        actions = interactive_menu()
+        if not actions:
+            resp = input("No actions selected. Press Enter to exit, or type 'r' to return to the menu: ").strip().lower()
+            if resp == "r":
+                continue
+            break
+        run_actions(actions, dry_run=args.dry_run, assume_yes=args.yes, fast_clean=args.fast_clean, refresh_wifi=args.refresh_wifi)
+        resp = input("Press Enter to return to the menu, or type 'exit' to quit: ").strip().lower()
+        if resp == "exit":
+            break
+
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        rc = main()
+    except KeyboardInterrupt:
+        print("\nInterrupted by user.")
+        rc = 1
+
+    try:
+        if launched_interactive:
+            input("Press Enter to close...")
+    except EOFError:
+        pass
+    sys.exit(rc)